@@ -1,9 +1,218 @@
 #!/usr/bin/env python3
 import csv
 import argparse
-from datetime import datetime
+import shutil
+import sys
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 import calendar
+import re
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
+
+# Timezones used for schedule conversion, built once rather than per row
+_NY_TZ = ZoneInfo("America/New_York")
+_PARIS_TZ = ZoneInfo("Europe/Paris")
+
+# Paris start hours considered Europe-friendly (13:00 through 22:xx)
+_OK_HOURS = frozenset(range(13, 23))
+
+# Paris is five or six hours ahead of New York depending on DST, so only these
+# New York start hours can land inside _OK_HOURS
+_NY_OK_HOURS = frozenset(hour - ahead for hour in _OK_HOURS for ahead in (5, 6))
+
+@dataclass
+class Game:
+    """A single Europe-friendly game with its display metadata."""
+
+    # Declared by hand rather than dataclass(slots=True) to keep Python 3.9 support
+    __slots__ = ('date', 'time', 'away_team', 'home_team',
+                 'is_highlighted', 'is_starred', 'is_weekend', 'is_canadian', 'dt',
+                 'prefix', 'wrap')
+
+    date: str
+    time: str
+    away_team: str
+    home_team: str
+    is_highlighted: bool
+    is_starred: bool
+    is_weekend: bool
+    is_canadian: bool
+    dt: datetime  # Full Paris datetime for calendar formatting
+    prefix: str  # Star and/or Canadian flag shown before the game text
+    wrap: str  # "bold" for starred or highlighted games, otherwise "none"
+
+def _parse_fast(date_str, time_str):
+    """Parse a schedule date and time into New York wall-clock fields.
+
+    The schedule uses a fixed "MM/DD/YYYY" and "HH:MM AM/PM" layout, so the
+    fields are sliced out directly instead of going through strptime. Anything
+    that does not fit that layout falls back to strptime. The fields are
+    returned unassembled so callers can reject a start hour before paying for
+    a datetime.
+
+    Args:
+        date_str: Date string from column A (e.g., "10/07/2025")
+        time_str: Time string from column C (e.g., "7:00 PM")
+
+    Returns:
+        Tuple of (year, month, day, hour, minute) in America/New_York local
+        time, with hour on a 24-hour clock
+
+    Raises:
+        ValueError: If the date or time cannot be parsed
+    """
+    try:
+        if date_str[2] != '/' or date_str[5] != '/' or len(date_str) != 10:
+            raise ValueError(date_str)
+        month_str = date_str[:2]
+        day_str = date_str[3:5]
+        year_str = date_str[6:10]
+
+        clock, marker = time_str.split(' ')
+        hour_str, minute_str = clock.split(':')
+        if len(hour_str) > 2 or len(minute_str) != 2:
+            raise ValueError(time_str)
+
+        # int() accepts signs and whitespace, so only plain ASCII digits are
+        # handled here; anything else is left to strptime
+        for field in (month_str, day_str, year_str, hour_str, minute_str):
+            if not (field.isascii() and field.isdigit()):
+                raise ValueError(field)
+
+        month = int(month_str)
+        day = int(day_str)
+        year = int(year_str)
+        hour = int(hour_str)
+        minute = int(minute_str)
+        if not 1 <= hour <= 12:
+            raise ValueError(time_str)
+
+        marker = marker.upper()
+        if marker == 'PM':
+            if hour != 12:
+                hour += 12
+        elif marker == 'AM':
+            if hour == 12:
+                hour = 0
+        else:
+            raise ValueError(time_str)
+
+        return year, month, day, hour, minute
+    except (ValueError, IndexError):
+        ny_time = datetime.strptime(f"{date_str} {time_str}", "%m/%d/%Y %I:%M %p")
+        return ny_time.year, ny_time.month, ny_time.day, ny_time.hour, ny_time.minute
+
+def _build_offset_table(start, end):
+    """Find every change in the New York -> Paris offset between two dates.
+
+    Both zones are probed at each New York midnight, and any day on which the
+    offsets change is rescanned hour by hour to find the first affected hour.
+    New York times are interpreted the same way as replace(tzinfo=_NY_TZ).
+
+    Args:
+        start: Naive New York datetime where the table begins
+        end: Naive New York datetime where the table ends
+
+    Returns:
+        Tuple of (sorted New York start times, matching Paris minus New York
+        offsets as timedeltas)
+    """
+    def offsets(ny_naive):
+        ny_offset = _NY_TZ.utcoffset(ny_naive)
+        utc_time = (ny_naive - ny_offset).replace(tzinfo=timezone.utc)
+        return ny_offset, _PARIS_TZ.utcoffset(utc_time.astimezone(_PARIS_TZ))
+
+    starts = [start]
+    current = offsets(start)
+    deltas = [current[1] - current[0]]
+
+    one_day = timedelta(days=1)
+    one_hour = timedelta(hours=1)
+    day = start
+    while day < end:
+        next_day = day + one_day
+        if offsets(next_day) != current:
+            hour = day + one_hour
+            while offsets(hour) == current:
+                hour += one_hour
+            current = offsets(hour)
+            starts.append(hour)
+            deltas.append(current[1] - current[0])
+        day = next_day
+
+    return starts, deltas
+
+# Offset changes covering the 2025/2026 season, from preseason through the final.
+# Only used at import time to build _DAY_DELTAS below
+_OFFSET_START = datetime(2025, 9, 1)
+_OFFSET_END = datetime(2026, 7, 1)
+_OFFSET_STARTS, _OFFSET_DELTAS = _build_offset_table(_OFFSET_START, _OFFSET_END)
+
+def _build_day_deltas(starts, deltas, start, end):
+    """Map each schedule date with a single Paris offset to that offset.
+
+    Days on which an offset change happens are left out, so those still go
+    through the full table lookup.
+
+    Args:
+        starts: Sorted New York start times from _build_offset_table
+        deltas: Matching Paris minus New York offsets
+        start: Naive New York datetime of the first day to map
+        end: Naive New York datetime where mapping stops
+
+    Returns:
+        Dict of schedule date strings ("MM/DD/YYYY") to timedelta offsets
+    """
+    day_deltas = {}
+    one_day = timedelta(days=1)
+    day = start
+    while day < end:
+        index = bisect_right(starts, day) - 1
+        next_change = starts[index + 1] if index + 1 < len(starts) else end
+        if next_change >= day + one_day:
+            day_deltas[f"{day.month:02d}/{day.day:02d}/{day.year:04d}"] = deltas[index]
+        day += one_day
+    return day_deltas
+
+# Per-date offsets keyed on the raw schedule date, so most rows need no bisect
+_DAY_DELTAS = _build_day_deltas(_OFFSET_STARTS, _OFFSET_DELTAS, _OFFSET_START, _OFFSET_END)
+
+def _to_paris(ny_naive, date_str=None):
+    """Convert a naive New York wall-clock datetime to Paris time.
+
+    Dates with a single Paris offset for the whole day are shifted using the
+    precomputed per-day table. DST change days and anything outside the season
+    window go through a regular timezone conversion, which also sets the right
+    fold for a repeated Paris hour.
+
+    Args:
+        ny_naive: Naive datetime holding the America/New_York local time
+        date_str: Optional schedule date string for ny_naive, used to look up
+            the offset for the whole day at once
+
+    Returns:
+        Timezone-aware datetime in Europe/Paris
+    """
+    delta = _DAY_DELTAS.get(date_str)
+    if delta is not None:
+        return (ny_naive + delta).replace(tzinfo=_PARIS_TZ)
+    return ny_naive.replace(tzinfo=_NY_TZ).astimezone(_PARIS_TZ)
+
+def _compile_team_pattern(teams):
+    """Compile team names into one case-insensitive substring pattern.
+
+    Args:
+        teams: List of team names (or partial names) to match
+
+    Returns:
+        Compiled regex matching any of the teams, or None if teams is empty
+    """
+    if not teams:
+        return None
+    return re.compile('|'.join(map(re.escape, teams)), re.IGNORECASE)
 
 def parse_and_filter_schedule(highlighted_teams=None, starred_teams=None, mark_weekend=False, mark_canada=False):
     """Process NHL schedule and find Europe-friendly game times."""
@@ -19,11 +228,40 @@ def parse_and_filter_schedule(highlighted_teams=None, starred_teams=None, mark_w
 
     europe_friendly_games = []
 
-    with open('nhl-schedule.csv', 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)  # Skip header row
+    # Match all team filters with a single case-insensitive pattern each
+    hi_re = _compile_team_pattern(highlighted_teams)
+    star_re = _compile_team_pattern(starred_teams)
+    # Schedule uses full team names, so Canadian matching is an exact lookup
+    _canadian_set = frozenset(canadian_teams)
+
+    # Decide once which team checks apply, so rows skip the ones that are off
+    has_highlight = hi_re is not None
+    has_star = star_re is not None
+    has_canada = mark_canada and bool(_canadian_set)
+
+    # Many games share a date, so format each Paris date only once
+    _date_cache = {}
+
+    # Bind the per-row helpers to locals so the loop skips global lookups
+    _parse = _parse_fast
+    _convert = _to_paris
+    _ny_ok_hours = _NY_OK_HOURS
+    _ok_hours = _OK_HOURS
+    _new_datetime = datetime
+
+    # A 1 MB buffer reads a full season's schedule in one go; newline='' keeps
+    # line endings untouched for csv, and they are stripped below anyway
+    with open('nhl-schedule.csv', 'r', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        header = next(f, None)  # Skip header row
+
+        for line in f:
+            # The schedule is plain comma-separated, so a split is enough;
+            # only hand quoted lines to csv in case a field contains a comma
+            if '"' in line:
+                row = next(csv.reader([line]), [])
+            else:
+                row = line.rstrip('\r\n').split(',')
 
-        for row in reader:
             if len(row) < 6:
                 continue
 
@@ -39,12 +277,16 @@ def parse_and_filter_schedule(highlighted_teams=None, starred_teams=None, mark_w
 
             try:
                 # Parse date and time in New York timezone
-                datetime_str = f"{date_str} {time_str}"
-                ny_time = datetime.strptime(datetime_str, "%m/%d/%Y %I:%M %p")
-                ny_time = ny_time.replace(tzinfo=ZoneInfo("America/New_York"))
+                ny_fields = _parse(date_str, time_str)
+
+                # Most games start in the NY evening and can never be Europe-friendly,
+                # so drop them before building a datetime or converting timezones
+                if ny_fields[3] not in _ny_ok_hours:
+                    continue
+                ny_time = _new_datetime(*ny_fields)
 
                 # Convert to Paris time
-                paris_time = ny_time.astimezone(ZoneInfo("Europe/Paris"))
+                paris_time = _convert(ny_time, date_str)
 
                 # Filter games starting at or before 22:00 Paris time
                 # Include games from 13:00 (1 PM) to 22:00 (10 PM) Paris time
@@ -55,40 +297,48 @@ def parse_and_filter_schedule(highlighted_teams=None, starred_teams=None, mark_w
                 paris_minute = paris_time.minute
 
                 # Include games from 13:00 through 22:00 Paris time
-                if 13 <= paris_hour <= 22:
+                if paris_hour in _ok_hours:
                     # Check if any highlighted team is playing
-                    is_highlighted = any(
-                        team.lower() in away_team.lower() or team.lower() in home_team.lower()
-                        for team in highlighted_teams
+                    is_highlighted = has_highlight and (
+                        hi_re.search(away_team) is not None or hi_re.search(home_team) is not None
                     )
 
                     # Check if any starred team is playing
-                    is_starred = any(
-                        team.lower() in away_team.lower() or team.lower() in home_team.lower()
-                        for team in starred_teams
+                    is_starred = has_star and (
+                        star_re.search(away_team) is not None or star_re.search(home_team) is not None
                     )
 
                     # Check if game is on Friday (4) or Saturday (5) and weekend marking is enabled
                     is_weekend = mark_weekend and paris_time.weekday() in [4, 5]
 
                     # Check if any Canadian team is playing and marking is enabled
-                    is_canadian = mark_canada and any(
-                        team in away_team or team in home_team
-                        for team in canadian_teams
+                    is_canadian = has_canada and (
+                        away_team in _canadian_set or home_team in _canadian_set
                     )
 
-                    europe_friendly_games.append({
-                        'date': paris_time.strftime('%Y-%m-%d'),
-                        'time': paris_time.strftime('%H:%M'),
-                        'ny_time': ny_time.strftime('%H:%M'),  # For debugging
-                        'away_team': away_team,
-                        'home_team': home_team,
-                        'is_highlighted': is_highlighted,
-                        'is_starred': is_starred,
-                        'is_weekend': is_weekend,
-                        'is_canadian': is_canadian,
-                        'datetime': paris_time  # Store full datetime for calendar formatting
-                    })
+                    # Work out the decorations now so rendering is just string assembly
+                    prefix = ("⭐ " if is_starred else "") + ("🇨🇦 " if is_canadian else "")
+                    wrap = "bold" if (is_starred or is_highlighted) else "none"
+
+                    game_date = paris_time.date()
+                    date_text = _date_cache.get(game_date)
+                    if date_text is None:
+                        date_text = f"{game_date.year:04d}-{game_date.month:02d}-{game_date.day:02d}"
+                        _date_cache[game_date] = date_text
+
+                    europe_friendly_games.append(Game(
+                        date=date_text,
+                        time=f"{paris_hour:02d}:{paris_minute:02d}",
+                        away_team=away_team,
+                        home_team=home_team,
+                        is_highlighted=is_highlighted,
+                        is_starred=is_starred,
+                        is_weekend=is_weekend,
+                        is_canadian=is_canadian,
+                        dt=paris_time,  # Store full datetime for calendar formatting
+                        prefix=prefix,
+                        wrap=wrap
+                    ))
 
             except (ValueError, IndexError) as e:
                 # Skip rows with parsing errors
@@ -100,7 +350,7 @@ def format_game_text(game, include_date=True):
     """Format a single game with all its decorations (stars, flags, italics, bold).
 
     Args:
-        game: Game dictionary with all metadata
+        game: Game record with all metadata
         include_date: Whether to include the date in the output (default True)
 
     Returns:
@@ -108,64 +358,74 @@ def format_game_text(game, include_date=True):
     """
     # Build the base game text
     if include_date:
-        game_text = f"{game['date']} at {game['time']} - {game['away_team']} @ {game['home_team']}"
+        game_text = f"{game.date} at {game.time} - {game.away_team} @ {game.home_team}"
     else:
-        game_text = f"{game['time']} - {game['away_team']} @ {game['home_team']}"
-
-    # Build prefix with star and/or Canadian flag
-    prefix = ""
-    if game['is_starred']:
-        prefix = "⭐ "
-    if game['is_canadian']:
-        prefix += "🇨🇦 "
+        game_text = f"{game.time} - {game.away_team} @ {game.home_team}"
 
     # Apply italics for weekend games
-    if game['is_weekend']:
+    if game.is_weekend:
         game_text = f"*{game_text}*"
 
     # Apply bold for starred or highlighted games
-    if game['is_starred'] or game['is_highlighted']:
-        return f"**{prefix}{game_text}**"
-    else:
-        return f"{prefix}{game_text}"
+    if game.wrap == "bold":
+        return f"**{game.prefix}{game_text}**"
+    return f"{game.prefix}{game_text}"
 
-def format_as_markdown(games, highlighted_teams=None, starred_teams=None):
-    """Format the games list as Markdown with highlighted and starred teams."""
+def _count_marked(games, highlighted_teams, starred_teams):
+    """Count highlighted and starred games for the header.
 
-    if highlighted_teams is None:
-        highlighted_teams = []
-    if starred_teams is None:
-        starred_teams = []
+    Args:
+        games: List of Game records
+        highlighted_teams: List of team names to highlight
+        starred_teams: List of team names to star
 
-    if not games:
-        return "# Europe-Friendly NHL Games (2025/2026)\n\nNo games found starting at or before 22:00 Paris time."
+    Returns:
+        Tuple of (highlighted count, starred count)
+    """
+    highlighted_count = starred_count = 0
+    if highlighted_teams or starred_teams:
+        for game in games:
+            highlighted_count += game.is_highlighted
+            starred_count += game.is_starred
+    return highlighted_count, starred_count
+
+def _write_header(write, games, highlighted_teams, starred_teams):
+    """Write the document header shared by the list and calendar views.
+
+    The header needs the highlighted and starred totals before any game is
+    written, so they are counted here in a pass that only reads two flags.
+
+    Args:
+        write: Callable that receives each piece of output text
+        games: List of Game records
+        highlighted_teams: List of team names to highlight
+        starred_teams: List of team names to star
+    """
+    highlighted_count, starred_count = _count_marked(games, highlighted_teams, starred_teams)
 
-    md = "# Europe-Friendly NHL Games (2025/2026)\n\n"
-    md += f"*Games starting at or before 22:00 Paris time (all times in 24-hour format)*\n\n"
-    md += f"**Total games found: {len(games)}**\n\n"
+    write("# Europe-Friendly NHL Games (2025/2026)\n\n")
+    write(f"*Games starting at or before 22:00 Paris time (all times in 24-hour format)*\n\n")
+    write(f"**Total games found: {len(games)}**\n\n")
 
-    # Count highlighted games
-    highlighted_games = [g for g in games if g['is_highlighted']]
-    if highlighted_games and highlighted_teams:
+    if highlighted_count and highlighted_teams:
         team_list = ', '.join(highlighted_teams)
-        md += f"**{team_list} games (highlighted): {len(highlighted_games)}**\n\n"
+        write(f"**{team_list} games (highlighted): {highlighted_count}**\n\n")
 
-    # Count starred games
-    starred_games = [g for g in games if g['is_starred']]
-    if starred_games and starred_teams:
+    if starred_count and starred_teams:
         team_list = ', '.join(starred_teams)
-        md += f"**{team_list} games (starred): {len(starred_games)}**\n\n"
-
-    md += "---\n\n"
+        write(f"**{team_list} games (starred): {starred_count}**\n\n")
 
-    for game in games:
-        formatted_game = format_game_text(game, include_date=True)
-        md += f"- {formatted_game}\n"
+    write("---\n\n")
 
-    return md
+def write_markdown(games, write, highlighted_teams=None, starred_teams=None):
+    """Write the games list as Markdown, piece by piece, through write.
 
-def format_as_calendar(games, highlighted_teams=None, starred_teams=None):
-    """Format the games list as a monthly calendar view using markdown tables."""
+    Args:
+        games: List of Game records
+        write: Callable that receives each piece of output text (e.g., f.write)
+        highlighted_teams: List of team names to highlight
+        starred_teams: List of team names to star
+    """
 
     if highlighted_teams is None:
         highlighted_teams = []
@@ -173,55 +433,71 @@ def format_as_calendar(games, highlighted_teams=None, starred_teams=None):
         starred_teams = []
 
     if not games:
-        return "# Europe-Friendly NHL Games (2025/2026)\n\nNo games found starting at or before 22:00 Paris time."
+        write("# Europe-Friendly NHL Games (2025/2026)\n\nNo games found starting at or before 22:00 Paris time.")
+        return
 
-    md = "# Europe-Friendly NHL Games (2025/2026)\n\n"
-    md += f"*Games starting at or before 22:00 Paris time (all times in 24-hour format)*\n\n"
-    md += f"**Total games found: {len(games)}**\n\n"
+    _write_header(write, games, highlighted_teams, starred_teams)
 
-    # Count highlighted games
-    highlighted_games = [g for g in games if g['is_highlighted']]
-    if highlighted_games and highlighted_teams:
-        team_list = ', '.join(highlighted_teams)
-        md += f"**{team_list} games (highlighted): {len(highlighted_games)}**\n\n"
+    for game in games:
+        formatted_game = format_game_text(game, include_date=True)
+        write(f"- {formatted_game}\n")
 
-    # Count starred games
-    starred_games = [g for g in games if g['is_starred']]
-    if starred_games and starred_teams:
-        team_list = ', '.join(starred_teams)
-        md += f"**{team_list} games (starred): {len(starred_games)}**\n\n"
+def format_as_markdown(games, highlighted_teams=None, starred_teams=None):
+    """Format the games list as Markdown with highlighted and starred teams."""
+    parts: list[str] = []
+    write_markdown(games, parts.append, highlighted_teams, starred_teams)
+    return "".join(parts)
 
-    md += "---\n\n"
+def _month_key(game):
+    """Return the Paris (year, month) a game falls in."""
+    return game.dt.year, game.dt.month
 
-    # Group games by year-month
-    from collections import defaultdict
-    games_by_month = defaultdict(list)
+def _day_key(game):
+    """Return the Paris day of the month a game falls on."""
+    return game.dt.day
 
-    for game in games:
-        dt = game['datetime']
-        year_month = (dt.year, dt.month)
-        games_by_month[year_month].append(game)
+def write_calendar(games, write, highlighted_teams=None, starred_teams=None):
+    """Write the games list as a monthly calendar view, piece by piece, through write.
+
+    Args:
+        games: List of Game records
+        write: Callable that receives each piece of output text (e.g., f.write)
+        highlighted_teams: List of team names to highlight
+        starred_teams: List of team names to star
+    """
+
+    if highlighted_teams is None:
+        highlighted_teams = []
+    if starred_teams is None:
+        starred_teams = []
+
+    if not games:
+        write("# Europe-Friendly NHL Games (2025/2026)\n\nNo games found starting at or before 22:00 Paris time.")
+        return
 
-    # Sort months chronologically
-    sorted_months = sorted(games_by_month.keys())
+    _write_header(write, games, highlighted_teams, starred_teams)
+
+    # Sort by Paris date so games can be grouped by month and day in one pass. The
+    # schedule is already chronological, and the stable sort keeps same-day games
+    # in schedule order
+    ordered_games = sorted(games, key=attrgetter('date'))
 
     # Create a calendar for each month
-    for year, month in sorted_months:
+    for (year, month), monthly_games in groupby(ordered_games, key=_month_key):
         month_name = calendar.month_name[month]
-        md += f"## {month_name} {year}\n\n"
+        write(f"## {month_name} {year}\n\n")
 
         # Create calendar header (Mon-Sun)
-        md += "| Mon | Tue | Wed | Thu | Fri | Sat | Sun |\n"
-        md += "|-----|-----|-----|-----|-----|-----|-----|\n"
+        write("| Mon | Tue | Wed | Thu | Fri | Sat | Sun |\n")
+        write("|-----|-----|-----|-----|-----|-----|-----|\n")
 
         # Get the calendar for this month
         cal = calendar.monthcalendar(year, month)
 
-        # Create a dict of games by day
-        games_by_day = defaultdict(list)
-        for game in games_by_month[(year, month)]:
-            day = game['datetime'].day
-            games_by_day[day].append(game)
+        # Days with games come out of groupby in ascending order, so walk them
+        # alongside the calendar days
+        daily_games = groupby(monthly_games, key=_day_key)
+        next_day, day_games = next(daily_games, (None, None))
 
         # Build the calendar rows
         for week in cal:
@@ -230,25 +506,27 @@ def format_as_calendar(games, highlighted_teams=None, starred_teams=None):
                 if day == 0:
                     # Empty cell for days not in this month
                     row_parts.append("")
+                elif day == next_day:
+                    # Format the cell with game info
+                    cell_games = [
+                        format_game_text(game, include_date=False)
+                        for game in day_games
+                    ]
+                    row_parts.append(f"**{day}**<br><br>" + "<br>".join(cell_games))
+                    next_day, day_games = next(daily_games, (None, None))
                 else:
-                    # Check if there are games on this day
-                    day_games = games_by_day.get(day, [])
-                    if day_games:
-                        # Format the cell with game info
-                        cell = f"**{day}**<br><br>"
-                        for game in day_games:
-                            formatted_game = format_game_text(game, include_date=False)
-                            cell += formatted_game + "<br>"
-                        row_parts.append(cell.rstrip("<br>"))
-                    else:
-                        # Just the day number
-                        row_parts.append(str(day))
+                    # Just the day number
+                    row_parts.append(str(day))
 
-            md += "| " + " | ".join(row_parts) + " |\n"
+            write("| " + " | ".join(row_parts) + " |\n")
 
-        md += "\n"
+        write("\n")
 
-    return md
+def format_as_calendar(games, highlighted_teams=None, starred_teams=None):
+    """Format the games list as a monthly calendar view using markdown tables."""
+    parts: list[str] = []
+    write_calendar(games, parts.append, highlighted_teams, starred_teams)
+    return "".join(parts)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
@@ -290,14 +568,17 @@ if __name__ == "__main__":
 
     games = parse_and_filter_schedule(highlighted_teams, starred_teams, args.weekend, args.canada)
 
-    # Choose formatting based on --calendar flag
-    if args.calendar:
-        markdown_output = format_as_calendar(games, highlighted_teams, starred_teams)
-    else:
-        markdown_output = format_as_markdown(games, highlighted_teams, starred_teams)
-
-    # Write to file
+    # Stream the output into the file as it is formatted
     with open('europe-friendly-games.md', 'w', encoding='utf-8') as f:
-        f.write(markdown_output)
-
-    print(markdown_output)
+        # Choose formatting based on --calendar flag
+        if args.calendar:
+            write_calendar(games, f.write, highlighted_teams, starred_teams)
+        else:
+            write_markdown(games, f.write, highlighted_teams, starred_teams)
+
+    # Echo the finished file only once it is closed, so a console error (e.g. a
+    # closed pipe or an encoding without emoji) cannot leave it cut short
+    with open('europe-friendly-games.md', 'r', encoding='utf-8') as f:
+        shutil.copyfileobj(f, sys.stdout)
+    # Console output has always ended with print()'s newline; the file has not
+    sys.stdout.write("\n")